@@ -14,24 +14,68 @@ Addresses: https://github.com/clawdbot/clawdbot/issues/1808
 """
 
 import argparse
-import glob
+import atexit
+import concurrent.futures
+import contextlib
+import dataclasses
+import functools
 import json
+import mmap
 import os
+import pickle
 import platform
 import re
 import subprocess
 import sys
 import shutil
+import tempfile
+import time
 from collections import Counter, defaultdict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 try:
     import yaml as _yaml
 except ImportError:
     _yaml = None
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# orjson parses bytes directly and is several times faster than stdlib json
+_loads = _orjson.loads if _orjson else json.loads
+_JSON_ERRORS = (json.JSONDecodeError, _orjson.JSONDecodeError) if _orjson else (json.JSONDecodeError,)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes (orjson when available)."""
+    if _orjson:
+        return _orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str, separators=(",", ":")).encode()
+
+
+def _json_default(obj):
+    """Fallback encoder: dataclasses as dicts, anything else as str."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+
+def _dumps_pretty(obj) -> bytes:
+    """Serialize obj to JSON bytes indented by two spaces (orjson when available).
+
+    orjson encodes dataclasses natively; stdlib json goes through _json_default.
+    """
+    if _orjson:
+        return _orjson.dumps(obj, default=str, option=_orjson.OPT_INDENT_2)
+    return json.dumps(obj, default=_json_default, indent=2).encode()
+
+# datetime.fromisoformat accepts a trailing "Z" natively from Python 3.11
+_FROMISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
 __version__ = "0.3.0"
 
 # ─── Defaults ────────────────────────────────────────────────────────────────
@@ -39,6 +83,9 @@ __version__ = "0.3.0"
 DEFAULT_CLAWDBOT_DIR = Path.home() / ".clawdbot"
 OPENCLAW_DIR = Path.home() / ".openclaw"
 RC_FILE = Path.home() / ".clawdscanrc"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "clawdscan"
+SESSION_CACHE_FILE = CACHE_DIR / "sessions.jsonl"
+SKILL_CACHE_FILE = CACHE_DIR / "skills.pkl"
 
 # Thresholds (overridable via ~/.clawdscanrc)
 BLOAT_SIZE_BYTES = 1 * 1024 * 1024       # 1 MB
@@ -46,6 +93,16 @@ BLOAT_MSG_COUNT = 300                     # messages
 STALE_DAYS = 7                            # days without activity
 ZOMBIE_HOURS = 48                         # hours: created but never got messages
 LARGE_SESSION_TOP_N = 15                  # top N in reports
+DEFAULT_JOBS = os.cpu_count() or 1        # worker processes for session parsing
+DEFAULT_IO_THREADS = min(32, DEFAULT_JOBS * 4)  # threads for I/O-bound per-file work
+MMAP_MIN_BYTES = 256 * 1024               # mmap session files larger than this
+
+# Optional analyze_session outputs; commands request only what they report
+SESSION_FIELDS = frozenset({"tools", "models", "custom_types"})
+
+# Byte-level pre-filter: only these entry types are worth a full JSON parse
+_PARSED_TYPES_RE = re.compile(rb'"type"\s*:\s*"(?:message|session|compaction|model_change|custom)"')
+_TIMESTAMP_RE = re.compile(rb'"timestamp"\s*:\s*"([^"]*)"')
 
 
 def load_rc_config() -> dict:
@@ -68,6 +125,17 @@ def load_rc_config() -> dict:
     return rc
 
 
+def _update_age_thresholds():
+    """Precompute the classify_session age cutoffs, in seconds."""
+    global _STALE_SECONDS, _ANCIENT_SECONDS, _ZOMBIE_SECONDS
+    _STALE_SECONDS = STALE_DAYS * 86400
+    _ANCIENT_SECONDS = STALE_DAYS * 4 * 86400
+    _ZOMBIE_SECONDS = ZOMBIE_HOURS * 3600
+
+
+_update_age_thresholds()
+
+
 def apply_rc_config():
     """Apply ~/.clawdscanrc overrides to module-level thresholds."""
     global BLOAT_SIZE_BYTES, BLOAT_MSG_COUNT, STALE_DAYS, ZOMBIE_HOURS, LARGE_SESSION_TOP_N
@@ -86,44 +154,81 @@ def apply_rc_config():
         ZOMBIE_HOURS = int(rc["zombie_hours"])
     if "top_n" in rc:
         LARGE_SESSION_TOP_N = int(rc["top_n"])
+    _update_age_thresholds()
 
 # Colors
+def _ansi(code: str):
+    """Build a colorizer with its escape prefix precomputed."""
+    prefix = f"\033[{code}m"
+    return staticmethod(lambda t: f"{prefix}{t}\033[0m")
+
+
 class C:
     """ANSI color codes (disabled if NO_COLOR or not a TTY)."""
     _enabled = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
 
-    @classmethod
-    def _w(cls, code: str, text: str) -> str:
-        return f"\033[{code}m{text}\033[0m" if cls._enabled else text
-
-    @classmethod
-    def red(cls, t): return cls._w("31", t)
-    @classmethod
-    def green(cls, t): return cls._w("32", t)
-    @classmethod
-    def yellow(cls, t): return cls._w("33", t)
-    @classmethod
-    def blue(cls, t): return cls._w("34", t)
-    @classmethod
-    def magenta(cls, t): return cls._w("35", t)
-    @classmethod
-    def cyan(cls, t): return cls._w("36", t)
-    @classmethod
-    def bold(cls, t): return cls._w("1", t)
-    @classmethod
-    def dim(cls, t): return cls._w("2", t)
+    # Decided once at import: the no-color path is a bare identity call
+    if _enabled:
+        red, green, yellow, blue = _ansi("31"), _ansi("32"), _ansi("33"), _ansi("34")
+        magenta, cyan, bold, dim = _ansi("35"), _ansi("36"), _ansi("1"), _ansi("2")
+    else:
+        red = green = yellow = blue = magenta = cyan = bold = dim = staticmethod(lambda t: t)
 
 
 # ─── Session Analysis ────────────────────────────────────────────────────────
 
-def analyze_session(filepath: Path) -> dict:
-    """Parse a session JSONL file and extract health metrics."""
+def _parse_ts(ts_str: str) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp, or return None if it is malformed."""
+    try:
+        if not _FROMISO_ACCEPTS_Z and ts_str.endswith("Z"):
+            ts_str = ts_str[:-1] + "+00:00"
+        return datetime.fromisoformat(ts_str)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _iter_lines(f, size: int):
+    """Yield raw lines from a binary file, mmap'ing it when it is large.
+
+    Below MMAP_MIN_BYTES the mmap setup costs more than a buffered read.
+    """
+    if size <= MMAP_MIN_BYTES:
+        yield from f
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        find = mm.find
+        pos = 0
+        while True:
+            nl = find(b"\n", pos)
+            if nl < 0:
+                break
+            yield mm[pos:nl]
+            pos = nl + 1
+        if pos < len(mm):
+            yield mm[pos:]
+
+
+def analyze_session(filepath: Path, st: Optional[os.stat_result] = None,
+                    fields: Optional[frozenset[str]] = None) -> dict:
+    """Parse a session JSONL file and extract health metrics.
+
+    Pass st to reuse a stat result the caller already holds. fields limits
+    the optional SESSION_FIELDS that are collected (None collects all);
+    counters that are not requested stay empty.
+    """
+    if st is None:
+        st = filepath.stat()
+    if fields is None:
+        fields = SESSION_FIELDS
+    want_tools = "tools" in fields
+    want_models = "models" in fields
+    want_custom = "custom_types" in fields
     stats = {
         "path": str(filepath),
         "filename": filepath.name,
-        "session_id": filepath.stem.replace(".jsonl", ""),
-        "size_bytes": filepath.stat().st_size,
-        "mtime": datetime.fromtimestamp(filepath.stat().st_mtime, tz=timezone.utc),
+        "session_id": filepath.stem,
+        "size_bytes": st.st_size,
+        "mtime": datetime.fromtimestamp(st.st_mtime, tz=timezone.utc),
         "messages": 0,
         "user_messages": 0,
         "assistant_messages": 0,
@@ -141,26 +246,46 @@ def analyze_session(filepath: Path) -> dict:
         "custom_types": Counter(),
     }
 
+    # Collected flat and counted once at the end (Counter's C fast path)
+    tools_used = []
+    custom_types = []
+
     try:
-        with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-            for line_num, line in enumerate(f):
+        with open(filepath, "rb") as f:
+            for line in _iter_lines(f, stats["size_bytes"]):
                 line = line.strip()
                 if not line:
                     continue
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    stats["errors"] += 1
-                    continue
-
-                entry_type = entry.get("type", "unknown")
-                ts_str = entry.get("timestamp")
-                ts = None
-                if ts_str:
+                m = None
+                if _PARSED_TYPES_RE.search(line) is None and line.count(b'"timestamp"') == 1:
+                    m = _TIMESTAMP_RE.search(line)
+                if m is not None and line.count(b"{", 0, m.start()) == 1:
+                    # Ignored entry types (thinking_level_change, ...) only
+                    # contribute their timestamp, so skip the JSON parse. The
+                    # shortcut needs the line's only "timestamp" key to sit in
+                    # the top-level object (no "{" before it but the opening
+                    # one); anything else gets the full parse below.
+                    # Truncated writes still show up as parse errors.
+                    if not (line.startswith(b"{") and line.endswith(b"}")):
+                        stats["errors"] += 1
+                        continue
+                    entry_type = None
+                    ts_str = m.group(1).decode("utf-8", errors="replace")
+                else:
                     try:
-                        ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
-                        pass
+                        entry = _loads(line)
+                    except (UnicodeDecodeError, *_JSON_ERRORS):
+                        # orjson rejects invalid UTF-8, lone surrogate escapes
+                        # and NaN; stdlib json accepts all three
+                        try:
+                            entry = json.loads(line.decode("utf-8", errors="replace"))
+                        except json.JSONDecodeError:
+                            stats["errors"] += 1
+                            continue
+                    entry_type = entry.get("type", "unknown")
+                    ts_str = entry.get("timestamp")
+                # Non-string values are not timestamps
+                ts = _parse_ts(ts_str) if isinstance(ts_str, str) else None
 
                 if ts:
                     if stats["first_timestamp"] is None or ts < stats["first_timestamp"]:
@@ -168,13 +293,8 @@ def analyze_session(filepath: Path) -> dict:
                     if stats["last_timestamp"] is None or ts > stats["last_timestamp"]:
                         stats["last_timestamp"] = ts
 
-                if entry_type == "session":
-                    stats["created"] = ts
-                    stats["cwd"] = entry.get("cwd")
-                    stats["label"] = entry.get("label") or entry.get("name")
-                    stats["session_id"] = entry.get("id", stats["session_id"])
-
-                elif entry_type == "message":
+                # Most entries are messages, so test that first
+                if entry_type == "message":
                     stats["messages"] += 1
                     msg = entry.get("message", {})
                     role = msg.get("role", "")
@@ -183,100 +303,331 @@ def analyze_session(filepath: Path) -> dict:
                     elif role == "assistant":
                         stats["assistant_messages"] += 1
                         # Count tool calls in assistant content blocks
-                        content = msg.get("content", [])
+                        content = msg.get("content", []) if want_tools else None
                         if isinstance(content, list):
-                            for block in content:
-                                if isinstance(block, dict):
-                                    if block.get("type") == "tool_use":
-                                        stats["tool_calls"] += 1
-                                        tool_name = block.get("name", "unknown")
-                                        stats["tools_used"][tool_name] += 1
-                    elif role == "toolResult":
+                            tool_blocks = [b for b in content
+                                           if type(b) is dict and b.get("type") == "tool_use"]
+                            if tool_blocks:
+                                stats["tool_calls"] += len(tool_blocks)
+                                tools_used.extend(b.get("name", "unknown") for b in tool_blocks)
+                    elif role == "toolResult" and want_tools:
                         # Clawdbot stores tool results as separate message entries
                         stats["tool_calls"] += 1
-                        tool_name = msg.get("toolName", "unknown")
-                        stats["tools_used"][tool_name] += 1
+                        tools_used.append(msg.get("toolName", "unknown"))
+
+                elif entry_type == "session":
+                    stats["created"] = ts
+                    stats["cwd"] = entry.get("cwd")
+                    stats["label"] = entry.get("label") or entry.get("name")
+                    stats["session_id"] = entry.get("id", stats["session_id"])
 
                 elif entry_type == "compaction":
                     stats["compactions"] += 1
 
                 elif entry_type == "model_change":
                     stats["model_changes"] += 1
-                    model_id = entry.get("modelId") or entry.get("model")
+                    model_id = (entry.get("modelId") or entry.get("model")) if want_models else None
                     if model_id:
                         stats["models_used"].add(model_id)
 
                 elif entry_type == "custom":
                     custom_type = entry.get("customType", "unknown")
-                    stats["custom_types"][custom_type] += 1
+                    if want_custom:
+                        custom_types.append(custom_type)
                     # Extract model from model-snapshot
-                    if custom_type == "model-snapshot":
+                    if want_models and custom_type == "model-snapshot":
                         data = entry.get("data", {})
                         model_id = data.get("modelId")
                         if model_id:
                             stats["models_used"].add(model_id)
 
-                elif entry_type == "thinking_level_change":
-                    pass  # Tracked but not counted specially
-
-                else:
-                    pass  # Unknown type
+                # thinking_level_change and unknown types are not counted
 
     except Exception as e:
         stats["errors"] += 1
         stats["error_detail"] = str(e)
 
+    stats["tools_used"] = Counter(tools_used)
+    stats["custom_types"] = Counter(custom_types)
     # Convert sets to lists for JSON serialization
     stats["models_used"] = list(stats["models_used"])
 
     return stats
 
 
-def classify_session(stats: dict, now: datetime) -> list[str]:
-    """Classify a session with health labels."""
-    labels = []
+def _analyze_one(item: tuple[str, os.stat_result], fields: Optional[frozenset[str]] = None) -> dict:
+    """Process-pool worker: analyze_session on a (path string, stat) pair (picklable)."""
+    filepath_str, st = item
+    return analyze_session(Path(filepath_str), st, fields)
+
+
+def session_executor(jobs: int):
+    """Return a process pool for parsing sessions, or a no-op context if jobs <= 1."""
+    if jobs and jobs > 1:
+        return concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+    return contextlib.nullcontext()
+
+
+def analyze_sessions(sessions: list[tuple[Path, os.stat_result]], executor=None,
+                     fields: Optional[frozenset[str]] = None) -> list[dict]:
+    """Analyze (path, stat) pairs from scan_sessions, in order.
+
+    Unchanged files are served from the on-disk session cache; the rest are
+    parsed, fanning out to executor when given.
+    """
+    if fields is None:
+        fields = SESSION_FIELDS
+    results = []
+    misses = []  # (index, path, stat, fields to collect)
+    for f, st in sessions:
+        stats, cached_fields = _session_cache_get(f, st, fields)
+        if stats is None:
+            # Widen to what the cache already had so entries don't ping-pong
+            misses.append((len(results), f, st, fields | cached_fields))
+        results.append(stats)
+
+    if executor is None:
+        parsed = (analyze_session(f, st, want) for _, f, st, want in misses)
+    else:
+        # chunksize amortizes IPC overhead across many small session files
+        parsed = executor.map(_analyze_one, [(str(f), st) for _, f, st, _ in misses],
+                              [want for _, _, _, want in misses], chunksize=8)
+    for (i, f, st, want), stats in zip(misses, parsed):
+        # Read failures may be transient (EACCES, EIO, mid-rotation), and
+        # fixing them need not touch the mtime, so never cache them
+        if "error_detail" not in stats:
+            _session_cache_put(f, st, want, stats)
+        results[i] = stats
+    return results
+
+
+# ─── Session Cache ───────────────────────────────────────────────────────────
+#
+# analyze_session results keyed on (path, mtime_ns, size), so repeated runs
+# only re-parse sessions that changed. Loaded lazily, written back at exit.
+
+_SESSION_CACHE_VERSION = 1
+_DATETIME_FIELDS = ("mtime", "first_timestamp", "last_timestamp", "created")
+_COUNTER_FIELDS = ("tools_used", "custom_types")
+_INT_FIELDS = ("size_bytes", "messages", "user_messages", "assistant_messages",
+               "tool_calls", "compactions", "model_changes", "errors")
+
+_session_cache: Optional[dict] = None   # abspath -> cache record
+_session_cache_dirty = False
+
+
+def _serialize_stats(stats: dict) -> dict:
+    """Make a stats dict JSON-safe (datetimes to ISO strings, Counters to dicts)."""
+    return {
+        k: (v.isoformat() if isinstance(v, datetime) else
+            dict(v) if isinstance(v, Counter) else v)
+        for k, v in stats.items()
+    }
+
+
+def _deserialize_stats(data: dict) -> dict:
+    """Inverse of _serialize_stats for the fields analyze_session produces."""
+    stats = dict(data)
+    for k in _DATETIME_FIELDS:
+        if stats.get(k) is not None:
+            stats[k] = datetime.fromisoformat(stats[k])
+    for k in _COUNTER_FIELDS:
+        stats[k] = Counter(stats.get(k) or {})
+    return stats
+
+
+def _valid_session_record(rec) -> bool:
+    """Whether rec is a well-formed current-version cache record."""
+    return (isinstance(rec, dict) and rec.get("v") == _SESSION_CACHE_VERSION
+            and isinstance(rec.get("path"), str)
+            and type(rec.get("mtime_ns")) is int
+            and type(rec.get("size")) is int
+            and isinstance(rec.get("fields"), list)
+            and all(isinstance(f, str) for f in rec["fields"])
+            and _valid_cached_stats(rec.get("stats")))
+
+
+def _valid_cached_stats(stats) -> bool:
+    """Whether stats carries the core analyze_session keys with the right types."""
+    return (isinstance(stats, dict)
+            and isinstance(stats.get("path"), str)
+            and isinstance(stats.get("session_id"), str)
+            and all(type(stats.get(k)) is int for k in _INT_FIELDS)
+            and isinstance(stats.get("mtime"), str)
+            and all(k in stats and (stats[k] is None or isinstance(stats[k], str))
+                    for k in _DATETIME_FIELDS)
+            and isinstance(stats.get("models_used"), list)
+            and all(isinstance(stats.get(k, {}), dict) for k in _COUNTER_FIELDS))
+
+
+def _load_session_cache() -> dict:
+    global _session_cache
+    if _session_cache is None:
+        _session_cache = {}
+        try:
+            with open(SESSION_CACHE_FILE, "rb") as f:
+                for line in f:
+                    try:
+                        rec = _loads(line)
+                    except _JSON_ERRORS:
+                        continue
+                    if _valid_session_record(rec):
+                        _session_cache[rec["path"]] = rec
+        except OSError:
+            pass
+        atexit.register(_save_session_cache)
+    return _session_cache
+
+
+def _session_cache_get(filepath: Path, st: os.stat_result,
+                       fields: frozenset[str]) -> tuple[Optional[dict], frozenset[str]]:
+    """Return (stats or None, fields the matching cache record holds)."""
+    rec = _load_session_cache().get(os.path.abspath(filepath))
+    if not rec or rec["mtime_ns"] != st.st_mtime_ns or rec["size"] != st.st_size:
+        return None, frozenset()
+    rec["seen"] = True
+    cached_fields = frozenset(rec["fields"])
+    if not fields <= cached_fields:
+        return None, cached_fields
+    try:
+        return _deserialize_stats(rec["stats"]), cached_fields
+    except (KeyError, ValueError, TypeError):
+        # Corrupt stats payload: re-parse and overwrite it
+        return None, frozenset()
+
+
+def _session_cache_put(filepath: Path, st: os.stat_result, fields: frozenset[str], stats: dict):
+    global _session_cache_dirty
+    path = os.path.abspath(filepath)
+    _load_session_cache()[path] = {
+        "v": _SESSION_CACHE_VERSION,
+        "path": path,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "fields": sorted(fields),
+        "stats": _serialize_stats(stats),
+        "seen": True,
+    }
+    _session_cache_dirty = True
+
+
+def _save_session_cache():
+    """Write the cache back atomically, dropping entries for removed files."""
+    if not _session_cache_dirty:
+        return
+    def write(f):
+        for path, rec in _session_cache.items():
+            if not rec.pop("seen", False) and not os.path.exists(path):
+                continue
+            f.write(_dumps(rec) + b"\n")
+
+    try:
+        _write_cache_file(SESSION_CACHE_FILE, write)
+    except OSError:
+        pass
+
+
+def _write_cache_file(dest: Path, write):
+    """Call write(f) on a private temp file in CACHE_DIR, then move it onto dest.
+
+    Each process gets its own temp file, so concurrent runs (a cron scan and
+    an exiting watch) never interleave their writes; the last rename wins.
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix=dest.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, dest)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+# Health flags: classify_session returns a bitmask of these
+MEGA_BLOAT = 1 << 0
+BLOATED = 1 << 1
+MSG_OVERFLOW = 1 << 2
+MSG_HEAVY = 1 << 3
+ANCIENT = 1 << 4
+STALE = 1 << 5
+ZOMBIE = 1 << 6
+OVER_COMPACTED = 1 << 7
+COMPACTED = 1 << 8
+PARSE_ERRORS = 1 << 9
+
+# Display labels, in report order
+LABEL_STRINGS = {
+    MEGA_BLOAT: "🔴 mega-bloat",
+    BLOATED: "🟡 bloated",
+    MSG_OVERFLOW: "🔴 msg-overflow",
+    MSG_HEAVY: "🟡 msg-heavy",
+    ANCIENT: "🔴 ancient",
+    STALE: "🟡 stale",
+    ZOMBIE: "👻 zombie",
+    OVER_COMPACTED: "📦 over-compacted",
+    COMPACTED: "📦 compacted",
+    PARSE_ERRORS: "⚠️ parse-errors",
+}
+HEALTHY_LABEL = "✅ healthy"
+
+SEVERITY_RED_MASK = MEGA_BLOAT | MSG_OVERFLOW | ANCIENT
+SEVERITY_YELLOW_MASK = BLOATED | MSG_HEAVY | STALE
+
+
+def classify_session(stats: dict, now: datetime) -> int:
+    """Classify a session, returning a bitmask of health flags (0 = healthy).
+
+    Use health_labels() to turn the result into display strings.
+    """
+    flags = 0
 
     # Size-based
-    if stats["size_bytes"] > BLOAT_SIZE_BYTES * 5:
-        labels.append("🔴 mega-bloat")
-    elif stats["size_bytes"] > BLOAT_SIZE_BYTES:
-        labels.append("🟡 bloated")
+    size = stats["size_bytes"]
+    if size > BLOAT_SIZE_BYTES * 5:
+        flags |= MEGA_BLOAT
+    elif size > BLOAT_SIZE_BYTES:
+        flags |= BLOATED
 
     # Message count
-    if stats["messages"] > BLOAT_MSG_COUNT * 3:
-        labels.append("🔴 msg-overflow")
-    elif stats["messages"] > BLOAT_MSG_COUNT:
-        labels.append("🟡 msg-heavy")
+    messages = stats["messages"]
+    if messages > BLOAT_MSG_COUNT * 3:
+        flags |= MSG_OVERFLOW
+    elif messages > BLOAT_MSG_COUNT:
+        flags |= MSG_HEAVY
 
     # Staleness
     last_activity = stats["last_timestamp"] or stats["mtime"]
     if last_activity:
-        age = now - last_activity
-        if age > timedelta(days=STALE_DAYS * 4):
-            labels.append("🔴 ancient")
-        elif age > timedelta(days=STALE_DAYS):
-            labels.append("🟡 stale")
+        age_s = (now - last_activity).total_seconds()
+        if age_s > _ANCIENT_SECONDS:
+            flags |= ANCIENT
+        elif age_s > _STALE_SECONDS:
+            flags |= STALE
 
     # Zombie: created but <3 messages and old
-    if stats["messages"] <= 2:
+    if messages <= 2:
         created = stats["created"] or stats["first_timestamp"]
-        if created and (now - created) > timedelta(hours=ZOMBIE_HOURS):
-            labels.append("👻 zombie")
+        if created and (now - created).total_seconds() > _ZOMBIE_SECONDS:
+            flags |= ZOMBIE
 
     # High compaction = session has been compacted many times
     if stats["compactions"] > 10:
-        labels.append("📦 over-compacted")
+        flags |= OVER_COMPACTED
     elif stats["compactions"] > 3:
-        labels.append("📦 compacted")
+        flags |= COMPACTED
 
     # Errors
     if stats["errors"] > 5:
-        labels.append("⚠️ parse-errors")
+        flags |= PARSE_ERRORS
+
+    return flags
 
-    if not labels:
-        labels.append("✅ healthy")
 
-    return labels
+def health_labels(flags: int) -> list[str]:
+    """Translate classify_session flags into display labels."""
+    return [label for bit, label in LABEL_STRINGS.items() if flags & bit] or [HEALTHY_LABEL]
 
 
 # ─── Formatting ───────────────────────────────────────────────────────────────
@@ -352,30 +703,53 @@ def discover_agents(base_dir: Path) -> list[dict]:
     if not agents_dir.exists():
         return []
 
+    # DirEntry.is_dir() answers from the readdir d_type, without a stat per entry
+    with os.scandir(agents_dir) as it:
+        agent_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
     agents = []
-    for agent_dir in sorted(agents_dir.iterdir()):
-        if not agent_dir.is_dir():
-            continue
-        sessions_dir = agent_dir / "sessions"
+    for agent_dir in agent_dirs:
+        sessions_dir = Path(agent_dir.path) / "sessions"
         if sessions_dir.exists():
             agents.append({
                 "name": agent_dir.name,
-                "path": str(agent_dir),
+                "path": agent_dir.path,
                 "sessions_dir": sessions_dir,
             })
     return agents
 
 
-def scan_sessions(sessions_dir: Path, include_deleted: bool = False) -> list[Path]:
-    """Find all session JSONL files."""
+class ScanResult(NamedTuple):
+    sessions: list[tuple[Path, os.stat_result]]
+    total_bytes: int
+    deleted_count: int
+
+
+def scan_sessions(sessions_dir: Path, include_deleted: bool = False) -> ScanResult:
+    """Find all session JSONL files, largest first, as (path, stat) pairs.
+
+    Each file is stat'ed exactly once; callers reuse the result, and the
+    combined size and the number of *.deleted.* entries (whatever their
+    extension) are accumulated during the same pass.
+    """
     files = []
-    for f in sessions_dir.iterdir():
-        if not f.name.endswith(".jsonl"):
-            continue
-        if ".deleted." in f.name and not include_deleted:
-            continue
-        files.append(f)
-    return sorted(files, key=lambda f: f.stat().st_size, reverse=True)
+    total = 0
+    deleted_count = 0
+    with os.scandir(sessions_dir) as it:
+        for entry in it:
+            name = entry.name
+            is_deleted = ".deleted." in name
+            if is_deleted and name[0] != ".":
+                deleted_count += 1
+            if not name.endswith(".jsonl"):
+                continue
+            if is_deleted and not include_deleted:
+                continue
+            st = entry.stat()
+            total += st.st_size
+            files.append((Path(entry.path), st))
+    files.sort(key=lambda f: f[1].st_size, reverse=True)
+    return ScanResult(files, total, deleted_count)
 
 
 def cmd_scan(args):
@@ -402,65 +776,68 @@ def cmd_scan(args):
     print(C.dim(f"   Scanning: {base_dir}"))
     print(C.dim(f"   Time: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"))
 
-    for agent in agents:
-        sessions = scan_sessions(agent["sessions_dir"], include_deleted=args.include_deleted)
-        deleted_count = len(list(agent["sessions_dir"].glob("*.deleted.*")))
-        agent_size = sum(f.stat().st_size for f in sessions)
-
-        print(C.bold(f"📁 Agent: {agent['name']}"))
-        print(f"   Sessions: {len(sessions)} active, {deleted_count} deleted")
-        print(f"   Disk: {fmt_size(agent_size)}")
-
-        agent_issues = []
-        for session_file in sessions:
-            stats = analyze_session(session_file)
-            labels = classify_session(stats, now)
-            stats["labels"] = labels
-            stats["agent"] = agent["name"]
-            all_stats.append(stats)
-
-            if not all(l.startswith("✅") for l in labels):
-                agent_issues.append(stats)
-
-        total_sessions += len(sessions)
-        total_size += agent_size
-        all_issues.extend(agent_issues)
-
-        # Show top issues for this agent
-        if agent_issues:
-            # Sort by size descending
-            agent_issues.sort(key=lambda s: s["size_bytes"], reverse=True)
-            shown = min(args.top, len(agent_issues))
-            print(f"   ⚠️  {len(agent_issues)} sessions with issues (showing top {shown}):\n")
-
-            for s in agent_issues[:shown]:
-                sid = s["session_id"][:12]
-                label_str = " ".join(s["labels"])
-                size = fmt_size(s["size_bytes"])
-                msgs = s["messages"]
-                age = fmt_age(s["last_timestamp"], now)
-                duration = fmt_duration(s["first_timestamp"], s["last_timestamp"])
-                models = ", ".join(s["models_used"][:2]) if s["models_used"] else "unknown"
-
-                # Use session label as primary identifier when available
-                display_name = C.cyan(s["label"]) if s.get("label") else C.dim(sid)
-
-                # Color the size
-                if s["size_bytes"] > BLOAT_SIZE_BYTES * 5:
-                    size = C.red(size)
-                elif s["size_bytes"] > BLOAT_SIZE_BYTES:
-                    size = C.yellow(size)
-
-                print(f"   {display_name:>20}  {size:>12}  {msgs:>5} msgs  {age:>10}  {label_str}")
-                if s.get("label"):
-                    print(f"   {'':20}  id: {C.dim(sid)}")
-                if s["compactions"] > 0:
-                    eff = fmt_compaction_efficiency(s["size_bytes"], s["compactions"])
-                    print(f"   {'':20}  compactions: {s['compactions']}, {eff}, duration: {duration}, models: {models}")
-        else:
-            print(f"   ✅ All sessions healthy\n")
+    # The console report only shows models; --verbose JSON dumps every field
+    fields = None if args.verbose else frozenset({"models"})
+
+    with session_executor(args.jobs) as executor:
+        for agent in agents:
+            sessions, agent_size, deleted_count = scan_sessions(
+                agent["sessions_dir"], include_deleted=args.include_deleted)
+
+            print(C.bold(f"📁 Agent: {agent['name']}"))
+            print(f"   Sessions: {len(sessions)} active, {deleted_count} deleted")
+            print(f"   Disk: {fmt_size(agent_size)}")
+
+            agent_issues = []
+            for stats in analyze_sessions(sessions, executor, fields):
+                flags = classify_session(stats, now)
+                stats["flags"] = flags
+                stats["labels"] = health_labels(flags)
+                stats["agent"] = agent["name"]
+                all_stats.append(stats)
+
+                if flags:
+                    agent_issues.append(stats)
+
+            total_sessions += len(sessions)
+            total_size += agent_size
+            all_issues.extend(agent_issues)
+
+            # Show top issues for this agent
+            if agent_issues:
+                # Sort by size descending
+                agent_issues.sort(key=lambda s: s["size_bytes"], reverse=True)
+                shown = min(args.top, len(agent_issues))
+                print(f"   ⚠️  {len(agent_issues)} sessions with issues (showing top {shown}):\n")
+
+                for s in agent_issues[:shown]:
+                    sid = s["session_id"][:12]
+                    label_str = " ".join(s["labels"])
+                    size = fmt_size(s["size_bytes"])
+                    msgs = s["messages"]
+                    age = fmt_age(s["last_timestamp"], now)
+                    duration = fmt_duration(s["first_timestamp"], s["last_timestamp"])
+                    models = ", ".join(s["models_used"][:2]) if s["models_used"] else "unknown"
+
+                    # Use session label as primary identifier when available
+                    display_name = C.cyan(s["label"]) if s.get("label") else C.dim(sid)
+
+                    # Color the size
+                    if s["size_bytes"] > BLOAT_SIZE_BYTES * 5:
+                        size = C.red(size)
+                    elif s["size_bytes"] > BLOAT_SIZE_BYTES:
+                        size = C.yellow(size)
+
+                    print(f"   {display_name:>20}  {size:>12}  {msgs:>5} msgs  {age:>10}  {label_str}")
+                    if s.get("label"):
+                        print(f"   {'':20}  id: {C.dim(sid)}")
+                    if s["compactions"] > 0:
+                        eff = fmt_compaction_efficiency(s["size_bytes"], s["compactions"])
+                        print(f"   {'':20}  compactions: {s['compactions']}, {eff}, duration: {duration}, models: {models}")
+            else:
+                print(f"   ✅ All sessions healthy\n")
 
-        print()
+            print()
 
     # ─── Summary ──────────────────────────────────────────────────────────
 
@@ -470,9 +847,15 @@ def cmd_scan(args):
     print(f"  Issues found:   {len(all_issues)}")
 
     # Classify by severity
-    red_issues = [s for s in all_issues if any("🔴" in l for l in s["labels"])]
-    yellow_issues = [s for s in all_issues if any("🟡" in l for l in s["labels"]) and s not in red_issues]
-    zombie_issues = [s for s in all_issues if any("👻" in l for l in s["labels"])]
+    red_issues, yellow_issues, zombie_issues = [], [], []
+    for s in all_issues:
+        flags = s["flags"]
+        if flags & SEVERITY_RED_MASK:
+            red_issues.append(s)
+        elif flags & SEVERITY_YELLOW_MASK:
+            yellow_issues.append(s)
+        if flags & ZOMBIE:
+            zombie_issues.append(s)
 
     if red_issues:
         print(C.red(f"  🔴 Critical:    {len(red_issues)} sessions"))
@@ -483,8 +866,8 @@ def cmd_scan(args):
 
     # Reclaimable space
     reclaimable = sum(s["size_bytes"] for s in zombie_issues)
-    stale_reclaimable = sum(s["size_bytes"] for s in all_issues
-                           if any("stale" in l or "ancient" in l for l in s["labels"]))
+    stale_issues = [s for s in all_issues if s["flags"] & (STALE | ANCIENT)]
+    stale_reclaimable = sum(s["size_bytes"] for s in stale_issues)
 
     if reclaimable > 0 or stale_reclaimable > 0:
         print()
@@ -492,8 +875,7 @@ def cmd_scan(args):
         if zombie_issues:
             print(f"    Zombie cleanup:  {fmt_size(reclaimable)} ({len(zombie_issues)} sessions)")
         if stale_reclaimable > 0:
-            stale_count = len([s for s in all_issues if any("stale" in l or "ancient" in l for l in s["labels"])])
-            print(f"    Stale cleanup:   {fmt_size(stale_reclaimable)} ({stale_count} sessions)")
+            print(f"    Stale cleanup:   {fmt_size(stale_reclaimable)} ({len(stale_issues)} sessions)")
 
     print()
 
@@ -515,7 +897,7 @@ def cmd_scan(args):
             print(f"     {len(zombie_issues)} sessions with ≤2 messages, older than {ZOMBIE_HOURS}h")
             print(f"     Fix: clawdscan clean --zombies --agent <name>")
 
-        stale_sessions = [s for s in all_issues if any("ancient" in l for l in s["labels"])]
+        stale_sessions = [s for s in all_issues if s["flags"] & ANCIENT]
         if stale_sessions:
             print(f"\n  🟡 ANCIENT — Consider archiving:")
             print(f"     {len(stale_sessions)} sessions with no activity for {STALE_DAYS * 4}+ days")
@@ -534,15 +916,20 @@ def cmd_scan(args):
             "critical_count": len(red_issues),
             "warning_count": len(yellow_issues),
             "zombie_count": len(zombie_issues),
-            "sessions": [{
-                k: (v.isoformat() if isinstance(v, datetime) else
-                    dict(v) if isinstance(v, Counter) else v)
-                for k, v in s.items()
-            } for s in all_stats] if args.verbose else None,
         }
         json_path = Path(args.json)
-        with open(json_path, "w") as f:
-            json.dump(output, f, indent=2, default=str)
+        if json_path.suffix.lower() == ".json":
+            output["sessions"] = [_serialize_stats(s) for s in all_stats] if args.verbose else None
+            with open(json_path, "w") as f:
+                json.dump(output, f, indent=2, default=str)
+        else:
+            # JSON Lines: the summary first, then one line per session, so
+            # sessions are never held in memory as one big document
+            with open(json_path, "wb") as f:
+                f.write(_dumps(output) + b"\n")
+                if args.verbose:
+                    for s in all_stats:
+                        f.write(_dumps(_serialize_stats(s)) + b"\n")
         print(f"📄 JSON report saved to: {json_path}")
 
 
@@ -554,15 +941,15 @@ def cmd_top(args):
     agents = discover_agents(base_dir)
     all_stats = []
 
-    for agent in agents:
-        if args.agent and agent["name"] != args.agent:
-            continue
-        sessions = scan_sessions(agent["sessions_dir"])
-        for session_file in sessions:
-            stats = analyze_session(session_file)
-            stats["labels"] = classify_session(stats, now)
-            stats["agent"] = agent["name"]
-            all_stats.append(stats)
+    with session_executor(args.jobs) as executor:
+        for agent in agents:
+            if args.agent and agent["name"] != args.agent:
+                continue
+            sessions = scan_sessions(agent["sessions_dir"]).sessions
+            for stats in analyze_sessions(sessions, executor, frozenset({"tools"})):
+                stats["labels"] = health_labels(classify_session(stats, now))
+                stats["agent"] = agent["name"]
+                all_stats.append(stats)
 
     if not all_stats:
         print("No sessions found.")
@@ -605,12 +992,13 @@ def cmd_inspect(args):
     now = datetime.now(timezone.utc)
 
     # Find the session file
-    session_file = None
+    session_file = st = None
     for agent in discover_agents(base_dir):
-        for f in agent["sessions_dir"].iterdir():
-            if args.session_id in f.name:
-                session_file = f
-                break
+        with os.scandir(agent["sessions_dir"]) as it:
+            for entry in it:
+                if args.session_id in entry.name:
+                    session_file, st = Path(entry.path), entry.stat()
+                    break
         if session_file:
             break
 
@@ -619,8 +1007,8 @@ def cmd_inspect(args):
         print("Tip: use the first 8+ chars of the session ID")
         sys.exit(1)
 
-    stats = analyze_session(session_file)
-    labels = classify_session(stats, now)
+    stats = analyze_session(session_file, st)
+    labels = health_labels(classify_session(stats, now))
 
     print(C.bold(f"\n🔬 Session Inspection: {stats['session_id'][:16]}"))
     print(f"   File: {stats['path']}")
@@ -689,19 +1077,19 @@ def cmd_clean(args):
 
     agents = discover_agents(base_dir)
     targets = []
+    size_threshold = parse_size(args.min_size) if args.min_size else None
 
     for agent in agents:
         if args.agent and agent["name"] != args.agent:
             continue
-        sessions = scan_sessions(agent["sessions_dir"])
-        for session_file in sessions:
-            stats = analyze_session(session_file)
-            labels = classify_session(stats, now)
+        sessions = scan_sessions(agent["sessions_dir"]).sessions
+        for (session_file, _), stats in zip(sessions, analyze_sessions(sessions, fields=frozenset())):
+            flags = classify_session(stats, now)
 
             should_clean = False
             reason = ""
 
-            if args.zombies and any("👻" in l for l in labels):
+            if args.zombies and flags & ZOMBIE:
                 should_clean = True
                 reason = "zombie (≤2 msgs, >48h old)"
 
@@ -711,8 +1099,7 @@ def cmd_clean(args):
                     should_clean = True
                     reason = f"stale (>{args.stale_days} days)"
 
-            if args.min_size:
-                size_threshold = parse_size(args.min_size)
+            if size_threshold is not None:
                 if stats["size_bytes"] > size_threshold:
                     should_clean = True
                     reason = f"oversized (>{args.min_size})"
@@ -773,14 +1160,14 @@ def cmd_tools(args):
     tool_totals = Counter()
     session_count = 0
 
-    for agent in agents:
-        if args.agent and agent["name"] != args.agent:
-            continue
-        sessions = scan_sessions(agent["sessions_dir"])
-        for session_file in sessions:
-            stats = analyze_session(session_file)
-            tool_totals += stats["tools_used"]
-            session_count += 1
+    with session_executor(args.jobs) as executor:
+        for agent in agents:
+            if args.agent and agent["name"] != args.agent:
+                continue
+            sessions = scan_sessions(agent["sessions_dir"]).sessions
+            for stats in analyze_sessions(sessions, executor, frozenset({"tools"})):
+                tool_totals += stats["tools_used"]
+                session_count += 1
 
     if not tool_totals:
         print("No tool usage found.")
@@ -806,16 +1193,16 @@ def cmd_models(args):
     model_messages = defaultdict(int)
     session_count = 0
 
-    for agent in agents:
-        if args.agent and agent["name"] != args.agent:
-            continue
-        sessions = scan_sessions(agent["sessions_dir"])
-        for session_file in sessions:
-            stats = analyze_session(session_file)
-            session_count += 1
-            for model in stats["models_used"]:
-                model_sessions[model] += 1
-                model_messages[model] += stats["messages"]
+    with session_executor(args.jobs) as executor:
+        for agent in agents:
+            if args.agent and agent["name"] != args.agent:
+                continue
+            sessions = scan_sessions(agent["sessions_dir"]).sessions
+            for stats in analyze_sessions(sessions, executor, frozenset({"models"})):
+                session_count += 1
+                for model in stats["models_used"]:
+                    model_sessions[model] += 1
+                    model_messages[model] += stats["messages"]
 
     if not model_sessions:
         print("No model usage found.")
@@ -831,6 +1218,54 @@ def cmd_models(args):
     print()
 
 
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """numpy if installed, else None; imported on first use to keep startup fast."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _size_percentiles(sizes: list[int]) -> tuple[int, int, int]:
+    """Median, P90 and P99 of sizes, indexed the same way as a sorted list."""
+    n = len(sizes)
+    idx = [n // 2, int(n * 0.9), int(n * 0.99)]
+    _np = _numpy()
+    if _np is not None:
+        # Quickselect on an int64 array: O(n) instead of a full sort
+        part = _np.partition(_np.fromiter(sizes, dtype=_np.int64, count=n), idx)
+        return tuple(int(part[i]) for i in idx)
+    ordered = sorted(sizes)
+    return tuple(ordered[i] for i in idx)
+
+
+def _dir_size(path) -> int:
+    """Total size of the regular files under path, walked with os.scandir.
+
+    DirEntry caches the d_type from readdir, so only files cost a stat call.
+    Directory symlinks are not descended into.
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        total += entry.stat().st_size
+                except OSError:
+                    pass
+    return total
+
+
 def cmd_disk(args):
     """Show disk usage breakdown."""
     base_dir = Path(args.dir) if args.dir else find_clawdbot_dir()
@@ -840,13 +1275,12 @@ def cmd_disk(args):
 
     total = 0
     for agent in agents:
-        sessions = scan_sessions(agent["sessions_dir"], include_deleted=True)
-        active = [f for f in sessions if ".deleted." not in f.name]
-        deleted = [f for f in sessions if ".deleted." in f.name]
+        sessions, agent_total, _ = scan_sessions(agent["sessions_dir"], include_deleted=True)
+        active = [st.st_size for f, st in sessions if ".deleted." not in f.name]
+        deleted = [st.st_size for f, st in sessions if ".deleted." in f.name]
 
-        active_size = sum(f.stat().st_size for f in active)
-        deleted_size = sum(f.stat().st_size for f in deleted)
-        agent_total = active_size + deleted_size
+        active_size = sum(active)
+        deleted_size = agent_total - active_size
 
         print(f"  {C.bold(agent['name']):20}")
         print(f"    Active:  {len(active):>5} sessions  {fmt_size(active_size):>10}")
@@ -855,10 +1289,7 @@ def cmd_disk(args):
 
         # Size distribution
         if active:
-            sizes = sorted([f.stat().st_size for f in active])
-            p50 = sizes[len(sizes) // 2]
-            p90 = sizes[int(len(sizes) * 0.9)]
-            p99 = sizes[int(len(sizes) * 0.99)]
+            p50, p90, p99 = _size_percentiles(active)
             print(f"    Median:  {fmt_size(p50):>10}  P90: {fmt_size(p90):>10}  P99: {fmt_size(p99):>10}")
 
         total += agent_total
@@ -872,7 +1303,7 @@ def cmd_disk(args):
     for d in other_dirs:
         p = base_dir / d
         if p.exists():
-            size = sum(f.stat().st_size for f in p.rglob("*") if f.is_file())
+            size = _dir_size(p)
             if size > 0:
                 print(f"  {d:20}  {fmt_size(size):>30}")
                 other_total += size
@@ -884,6 +1315,86 @@ def cmd_disk(args):
     print()
 
 
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+_FADV_SEQUENTIAL = getattr(os, "POSIX_FADV_SEQUENTIAL", None)
+CLASSIFY_CHUNK_BYTES = 16 * 1024
+
+
+def _open_noatime(path) -> int:
+    """os.open for reading, skipping atime updates where the OS allows it."""
+    if _O_NOATIME:
+        try:
+            return os.open(path, os.O_RDONLY | _O_NOATIME)
+        except PermissionError:
+            # O_NOATIME is only permitted on files we own
+            pass
+    return os.open(path, os.O_RDONLY)
+
+
+def _classify(path, size: int) -> tuple[bool, bool]:
+    """Thread-pool worker: (is_bloated, is_zombie) for a session file.
+
+    Messages are JSONL lines, but only the `> BLOAT_MSG_COUNT` and `<= 2`
+    questions matter, so the file is read in chunks only until both are
+    answered. Files over BLOAT_SIZE_BYTES are bloated from size alone.
+    """
+    bloated = size > BLOAT_SIZE_BYTES
+    count = 0
+    last = b"\n"
+    try:
+        fd = _open_noatime(path)
+    except OSError:
+        return bloated, True
+    try:
+        if _FADV_SEQUENTIAL is not None and size > CLASSIFY_CHUNK_BYTES:
+            # Multi-chunk scan: ask for a larger read-ahead window
+            os.posix_fadvise(fd, 0, 0, _FADV_SEQUENTIAL)
+        while True:
+            chunk = os.read(fd, CLASSIFY_CHUNK_BYTES)
+            if not chunk:
+                break
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+            if count > 2 and (bloated or count > BLOAT_MSG_COUNT):
+                return True, False
+    except OSError:
+        # Unreadable mid-way: report what has been counted so far
+        pass
+    finally:
+        os.close(fd)
+    if last != b"\n":
+        count += 1  # final line without a trailing newline
+    return bloated or count > BLOAT_MSG_COUNT, count <= 2
+
+
+def _week_buckets(offsets: list[float], sizes: list[int], bloated: list[bool],
+                  zombies: list[bool]) -> tuple[list[int], list[int], list[int], list[int]]:
+    """Per-week session count, total size, bloated and zombie counts.
+
+    offsets are seconds since the start of the window; week i holds offsets
+    in [i, i + 1) * 7 days and the lists run up to the last non-empty week.
+    """
+    _np = _numpy()
+    if _np is not None:
+        weeks = (_np.asarray(offsets, dtype=_np.float64) // 604800).astype(_np.int64)
+        n = int(weeks.max()) + 1
+        counts = _np.bincount(weeks, minlength=n)
+        totals = _np.bincount(weeks, weights=_np.asarray(sizes, dtype=_np.float64), minlength=n)
+        bloat_counts = _np.bincount(weeks[_np.asarray(bloated, dtype=bool)], minlength=n)
+        zombie_counts = _np.bincount(weeks[_np.asarray(zombies, dtype=bool)], minlength=n)
+        return (counts.tolist(), [int(t) for t in totals],
+                bloat_counts.tolist(), zombie_counts.tolist())
+    weeks = [int(o // 604800) for o in offsets]
+    n = max(weeks) + 1
+    counts, totals, bloat_counts, zombie_counts = [0] * n, [0] * n, [0] * n, [0] * n
+    for week, size, is_bloated, is_zombie in zip(weeks, sizes, bloated, zombies):
+        counts[week] += 1
+        totals[week] += size
+        bloat_counts[week] += is_bloated
+        zombie_counts[week] += is_zombie
+    return counts, totals, bloat_counts, zombie_counts
+
+
 def cmd_history(args):
     """Display session health trends over time."""
     base_dir = Path(args.dir) if args.dir else find_clawdbot_dir()
@@ -895,119 +1406,90 @@ def cmd_history(args):
 
     print(C.bold(f"\n📈 Session Health Trends (Last {days} Days)\n"))
     
-    # Collect all sessions across agents
-    all_sessions = []
+    # Collect all sessions across agents, as parallel lists; ages are plain
+    # epoch arithmetic, with no datetime per session
+    start_epoch = start_date.timestamp()
+    files, sizes, offsets = [], [], []
     for agent in agents:
-        sessions = scan_sessions(agent["sessions_dir"])
-        for session_file in sessions:
+        sessions = scan_sessions(agent["sessions_dir"]).sessions
+        for session_file, st in sessions:
             if ".deleted." in session_file.name:
                 continue
-            try:
-                created = datetime.fromtimestamp(session_file.stat().st_mtime, timezone.utc)
-                if created >= start_date:
-                    size = session_file.stat().st_size
-                    # Count messages by reading file
-                    message_count = 0
-                    try:
-                        with open(session_file, 'r') as f:
-                            for line in f:
-                                if line.strip():
-                                    message_count += 1
-                    except:
-                        message_count = 0
-                    
-                    all_sessions.append({
-                        'file': session_file,
-                        'created': created,
-                        'size': size,
-                        'messages': message_count,
-                        'agent': agent['name']
-                    })
-            except Exception:
-                continue
-    
-    if not all_sessions:
+            offset = st.st_mtime - start_epoch
+            if offset >= 0:
+                files.append(session_file)
+                sizes.append(st.st_size)
+                offsets.append(offset)
+
+    if not files:
         print("No sessions found in the specified time range.")
         return
-    
-    # Group sessions by week
-    history_data = {}
-    
-    for session in all_sessions:
-        created_date = session['created']
-        days_from_start = (created_date - start_date).days
-        week_num = days_from_start // 7
-        week_key = f"Week {week_num + 1}"
-        
-        if week_key not in history_data:
-            history_data[week_key] = {
-                'sessions': [],
-                'total_size': 0,
-                'bloated': 0,
-                'zombies': 0,
-                'date_range': None
-            }
-        
-        history_data[week_key]['sessions'].append(session)
-        history_data[week_key]['total_size'] += session['size']
-        
-        # Check for bloated sessions
-        if session['size'] > BLOAT_SIZE_BYTES or session['messages'] > BLOAT_MSG_COUNT:
-            history_data[week_key]['bloated'] += 1
-        
-        # Check for zombie sessions (very few messages)
-        if session['messages'] <= 2:
-            history_data[week_key]['zombies'] += 1
-
-    # Calculate date ranges for each week
-    for week_key, data in history_data.items():
-        week_num = int(week_key.split()[1]) - 1
-        week_start = start_date + timedelta(days=week_num * 7)
-        week_end = min(week_start + timedelta(days=6), now)
-        data['date_range'] = f"{week_start.strftime('%b %d')}-{week_end.strftime('%d')}"
+
+    # Flag bloat/zombies; reads release the GIL, so threads overlap the I/O waits
+    if args.jobs > 1 and len(files) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(pool.map(_classify, files, sizes))
+    else:
+        results = list(map(_classify, files, sizes))
+    bloated = [r[0] for r in results]
+    zombies = [r[1] for r in results]
+
+    # Group sessions by week; the list is in week order and holds only
+    # weeks that have sessions
+    history_data = [
+        {
+            'week': week_num,
+            'count': count,
+            'total_size': total_size,
+            'bloated': week_bloated,
+            'zombies': week_zombies,
+        }
+        for week_num, (count, total_size, week_bloated, week_zombies) in enumerate(
+            zip(*_week_buckets(offsets, sizes, bloated, zombies)))
+        if count
+    ]
 
     prev_sessions = 0
     prev_size = 0
+    bloat_counts = []
+    zombie_counts = []
 
-    for week_key in sorted(history_data.keys(), key=lambda x: int(x.split()[1])):
-        data = history_data[week_key]
-        session_count = len(data['sessions'])
+    for data in history_data:
+        session_count = data['count']
         total_size = data['total_size']
-        
+        week_key = f"Week {data['week'] + 1}"
+        week_start = start_date + timedelta(days=data['week'] * 7)
+        week_end = min(week_start + timedelta(days=6), now)
+        date_range = f"{week_start.strftime('%b %d')}-{week_end.strftime('%d')}"
+        bloat_counts.append(str(data['bloated']))
+        zombie_counts.append(str(data['zombies']))
+
         # Calculate growth
         if prev_sessions > 0:
             session_growth = ((session_count - prev_sessions) / prev_sessions) * 100
             size_growth = ((total_size - prev_size) / prev_size) * 100 if prev_size > 0 else 0
             growth_indicator = "📈" if session_growth > 10 else "📊" if session_growth > 0 else "📉"
-            print(f"{week_key} ({data['date_range']}): {session_count:3d} sessions, {fmt_size(total_size):>8s} "
+            print(f"{week_key} ({date_range}): {session_count:3d} sessions, {fmt_size(total_size):>8s} "
                   f"{growth_indicator} {session_growth:+.0f}% sessions, {size_growth:+.0f}% size")
         else:
-            print(f"{week_key} ({data['date_range']}): {session_count:3d} sessions, {fmt_size(total_size):>8s}")
+            print(f"{week_key} ({date_range}): {session_count:3d} sessions, {fmt_size(total_size):>8s}")
         
         prev_sessions = session_count
         prev_size = total_size
 
     # Show issue trends
     print(f"\n{C.bold('🔥 Issue Trends:')}")
-    bloat_counts = []
-    zombie_counts = []
-    
-    for week_key in sorted(history_data.keys(), key=lambda x: int(x.split()[1])):
-        data = history_data[week_key]
-        bloat_counts.append(str(data['bloated']))
-        zombie_counts.append(str(data['zombies']))
-    
     print(f"Bloated Sessions: {' → '.join(bloat_counts)}")
     print(f"Zombie Sessions:  {' → '.join(zombie_counts)}")
 
     # Calculate overall growth rate
     if len(history_data) > 1:
-        first_week = list(history_data.values())[0]
-        last_week = list(history_data.values())[-1]
+        first_week = history_data[0]
+        last_week = history_data[-1]
         
         weeks = len(history_data)
-        if len(first_week['sessions']) > 0:
-            session_growth_rate = ((len(last_week['sessions']) / len(first_week['sessions'])) ** (1/weeks) - 1) * 100
+        if first_week['count'] > 0:
+            session_growth_rate = ((last_week['count'] / first_week['count']) ** (1/weeks) - 1) * 100
         else:
             session_growth_rate = 0
             
@@ -1023,8 +1505,6 @@ def cmd_history(args):
 
 def cmd_watch(args):
     """Watch sessions directory and alert when thresholds are crossed."""
-    import time
-
     base_dir = Path(args.dir) if args.dir else find_clawdbot_dir()
     interval = args.interval
 
@@ -1042,12 +1522,11 @@ def cmd_watch(args):
             new_alerts = []
 
             for agent in agents:
-                sessions = scan_sessions(agent["sessions_dir"])
-                for session_file in sessions:
-                    stats = analyze_session(session_file)
-                    labels = classify_session(stats, now)
+                sessions = scan_sessions(agent["sessions_dir"]).sessions
+                for stats in analyze_sessions(sessions, fields=frozenset()):
+                    flags = classify_session(stats, now)
 
-                    if not all(l.startswith("✅") for l in labels):
+                    if flags:
                         issue_key = stats["session_id"]
                         current_issues.add(issue_key)
 
@@ -1056,7 +1535,7 @@ def cmd_watch(args):
                             new_alerts.append(
                                 f"  ⚡ NEW: {display} ({agent['name']}) — "
                                 f"{fmt_size(stats['size_bytes'])}, {stats['messages']} msgs — "
-                                f"{' '.join(labels)}"
+                                f"{' '.join(health_labels(flags))}"
                             )
 
             if new_alerts:
@@ -1077,15 +1556,18 @@ def cmd_watch(args):
         print(f"\n\n👋 Watch stopped.")
 
 
+_SIZE_RE = re.compile(r'^\s*(\d+(?:\.\d*)?|\.\d+)\s*([KMGT]?B?)\s*$', re.IGNORECASE)
+_SIZE_MULT = {"": 1, "B": 1, "K": 1024, "KB": 1024, "M": 1024**2, "MB": 1024**2,
+              "G": 1024**3, "GB": 1024**3, "T": 1024**4, "TB": 1024**4}
+
+
 def parse_size(s: str) -> int:
     """Parse size string like '5M', '100K', '1G'."""
-    s = s.strip().upper()
-    multipliers = {"B": 1, "K": 1024, "KB": 1024, "M": 1024**2, "MB": 1024**2,
-                   "G": 1024**3, "GB": 1024**3}
-    for suffix, mult in sorted(multipliers.items(), key=lambda x: -len(x[0])):
-        if s.endswith(suffix):
-            return int(float(s[:-len(suffix)]) * mult)
-    return int(s)
+    m = _SIZE_RE.match(s)
+    if not m:
+        raise ValueError(f"invalid size: {s!r}")
+    num, suffix = m.groups()
+    return int(float(num) * _SIZE_MULT[suffix.upper()])
 
 
 # ─── Skill Health Check ──────────────────────────────────────────────────────
@@ -1096,12 +1578,15 @@ DEFAULT_SKILL_DIRS = [
 ]
 
 
+_expanduser = functools.lru_cache(maxsize=None)(os.path.expanduser)
+
+
 def _get_skill_dirs(extra_dirs=None):
     """Build skill directory list from OpenClaw config + defaults + extra dirs."""
     dirs = list(DEFAULT_SKILL_DIRS)
     for config_path in [
-        os.path.expanduser("~/.openclaw/openclaw.json"),
-        os.path.expanduser("~/.clawdbot/clawdbot.json"),
+        _expanduser("~/.openclaw/openclaw.json"),
+        _expanduser("~/.clawdbot/clawdbot.json"),
     ]:
         try:
             with open(config_path) as f:
@@ -1109,45 +1594,61 @@ def _get_skill_dirs(extra_dirs=None):
             agents_cfg = config.get("agents", {}).get("defaults", {})
             skill_dirs_cfg = agents_cfg.get("skillDirs", [])
             if isinstance(skill_dirs_cfg, list):
-                dirs.extend([os.path.expanduser(p) for p in skill_dirs_cfg])
+                dirs.extend([_expanduser(p) for p in skill_dirs_cfg])
             elif isinstance(skill_dirs_cfg, str):
-                dirs.append(os.path.expanduser(skill_dirs_cfg))
+                dirs.append(_expanduser(skill_dirs_cfg))
             skills_cfg = config.get("skills", {})
             if isinstance(skills_cfg, dict):
                 for key in ("dirs", "paths", "directories"):
                     paths = skills_cfg.get(key, [])
                     if isinstance(paths, list):
-                        dirs.extend([os.path.expanduser(p) for p in paths])
+                        dirs.extend([_expanduser(p) for p in paths])
                     elif isinstance(paths, str):
-                        dirs.append(os.path.expanduser(paths))
+                        dirs.append(_expanduser(paths))
             break
         except (FileNotFoundError, json.JSONDecodeError, KeyError):
             continue
     if extra_dirs:
-        dirs.extend([os.path.expanduser(d) for d in extra_dirs])
+        dirs.extend([_expanduser(d) for d in extra_dirs])
+    # Dedupe on directory identity: one stat per dir resolves symlinks, where
+    # realpath would lstat every path component
     seen = set()
     unique = []
     for d in dirs:
-        real = os.path.realpath(d)
-        if real not in seen:
-            seen.add(real)
+        try:
+            st = os.stat(d)
+            key = (st.st_dev, st.st_ino)
+        except OSError:
+            key = os.path.normpath(os.path.abspath(d))
+        if key not in seen:
+            seen.add(key)
             unique.append(d)
     return unique
 
 
+FRONTMATTER_CHUNK_BYTES = 8192
+
+
 def _parse_skill_frontmatter(path):
     """Extract YAML frontmatter from SKILL.md."""
+    # Read only as far as the closing delimiter; the markdown body is not needed
     try:
-        with open(path) as f:
-            content = f.read()
+        with open(path, "rb") as f:
+            head = f.read(FRONTMATTER_CHUNK_BYTES)
+            if not head.startswith(b"---"):
+                return None
+            end = head.find(b"---", 3)
+            while end == -1:
+                chunk = f.read(FRONTMATTER_CHUNK_BYTES)
+                if not chunk:
+                    return None
+                # The delimiter may straddle the chunk boundary
+                start = max(3, len(head) - 2)
+                head += chunk
+                end = head.find(b"---", start)
+        fm_text = head[3:end].decode().strip()
     except Exception:
         return None
-    if not content.startswith("---"):
-        return None
-    end = content.find("---", 3)
-    if end == -1:
-        return None
-    fm_text = content[3:end].strip()
     try:
         if _yaml:
             return _yaml.safe_load(fm_text)
@@ -1156,89 +1657,246 @@ def _parse_skill_frontmatter(path):
         return _parse_simple_fm(fm_text)
 
 
+# Parsed frontmatter keyed on (path, mtime_ns, size), and skill directory
+# listings keyed on (path, mtime_ns); the parser tag keeps PyYAML and
+# fallback-parser results apart.
+_SKILL_CACHE_VERSION = 3
+# Directories modified this recently are listed but not cached: on
+# filesystems with 1-2 s mtime granularity (HFS+, ext3, FAT, some NFS) an
+# entry added later in the same tick would leave the mtime unchanged.
+_RACY_MTIME_NS = 2_000_000_000
+_SKILL_PARSER = "yaml" if _yaml else "simple"
+
+# {"files": abspath -> (mtime_ns, size, frontmatter),
+#  "dirs": abspath -> (mtime_ns, subdirectory names)}
+_skill_cache: Optional[dict] = None
+_skill_cache_dirty = False
+
+
+def _load_skill_cache() -> dict:
+    global _skill_cache
+    if _skill_cache is None:
+        _skill_cache = {"files": {}, "dirs": {}}
+        try:
+            with open(SKILL_CACHE_FILE, "rb") as f:
+                data = pickle.load(f)
+            if (isinstance(data, dict) and data.get("v") == _SKILL_CACHE_VERSION
+                    and data.get("parser") == _SKILL_PARSER):
+                _skill_cache = {"files": data["files"], "dirs": data["dirs"]}
+        except Exception:
+            # Missing, truncated or from an incompatible version: start over
+            pass
+        atexit.register(_save_skill_cache)
+    return _skill_cache
+
+
+def _cached_skill_frontmatter(path, st: os.stat_result):
+    """_parse_skill_frontmatter, memoized on disk while the file is unchanged."""
+    global _skill_cache_dirty
+    cache = _load_skill_cache()["files"]
+    key = os.path.abspath(path)
+    hit = cache.get(key)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    fm = _parse_skill_frontmatter(path)
+    cache[key] = (st.st_mtime_ns, st.st_size, fm)
+    _skill_cache_dirty = True
+    return fm
+
+
+def _skill_subdirs(skill_dir) -> list[str]:
+    """Names of skill_dir's non-hidden subdirectories, cached on its mtime.
+
+    Creating, removing or renaming an entry updates the directory's mtime,
+    so an unchanged mtime means an unchanged listing, provided the listing
+    was taken well after that mtime (see _RACY_MTIME_NS). Raises OSError if
+    skill_dir cannot be read.
+    """
+    global _skill_cache_dirty
+    st = os.stat(skill_dir)
+    cache = _load_skill_cache()["dirs"]
+    key = os.path.abspath(skill_dir)
+    hit = cache.get(key)
+    if hit and hit[0] == st.st_mtime_ns:
+        return hit[1]
+    listed_ns = time.time_ns()
+    with os.scandir(skill_dir) as it:
+        names = [entry.name for entry in it
+                 if not entry.name.startswith(".") and entry.is_dir()]
+    if listed_ns - st.st_mtime_ns >= _RACY_MTIME_NS:
+        cache[key] = (st.st_mtime_ns, names)
+        _skill_cache_dirty = True
+    else:
+        cache.pop(key, None)
+    return names
+
+
+def _save_skill_cache():
+    """Write the skill cache back atomically, dropping removed paths."""
+    if not _skill_cache_dirty:
+        return
+    data = {"v": _SKILL_CACHE_VERSION, "parser": _SKILL_PARSER}
+    for section, entries in _skill_cache.items():
+        data[section] = {k: v for k, v in entries.items() if os.path.exists(k)}
+    try:
+        _write_cache_file(SKILL_CACHE_FILE,
+                          lambda f: pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL))
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+# "key: value" lines; [^\S\n] keeps the whitespace runs from spanning lines
+_FM_KV_RE = re.compile(r'^(\w[\w-]*)[^\S\n]*:[^\S\n]*(.+)$', re.M)
+_FM_OPENCLAW_RE = re.compile(r'"openclaw"\s*:\s*(\{[^}]*(?:\{[^}]*\}[^}]*)*\})')
+_FM_META_RE = re.compile(r'metadata\s*:\s*\n\s*(\{[\s\S]*?\})\s*(?:\n---|\Z)')
+
+
 def _parse_simple_fm(text):
     """Minimal frontmatter parser without PyYAML."""
     result = {}
-    for line in text.split("\n"):
-        m = re.match(r'^(\w[\w-]*)\s*:\s*(.+)$', line)
-        if m:
-            key, val = m.group(1), m.group(2).strip()
-            if val.startswith('"') and val.endswith('"'):
-                val = val[1:-1]
-            result[key] = val
-    json_match = re.search(r'"openclaw"\s*:\s*(\{[^}]*(?:\{[^}]*\}[^}]*)*\})', text)
+    for m in _FM_KV_RE.finditer(text):
+        key, val = m.group(1), m.group(2).strip()
+        if val.startswith('"') and val.endswith('"'):
+            val = val[1:-1]
+        result[key] = val
+    json_match = _FM_OPENCLAW_RE.search(text)
     if json_match:
         try:
-            oc = json.loads(json_match.group(1))
+            oc = _loads(json_match.group(1))
             if "metadata" not in result or not isinstance(result.get("metadata"), dict):
                 result["metadata"] = {}
             result["metadata"]["openclaw"] = oc
-        except json.JSONDecodeError:
+        except _JSON_ERRORS:
             pass
-    meta_match = re.search(r'metadata\s*:\s*\n\s*(\{[\s\S]*?\})\s*\n---', text + "\n---")
+    meta_match = _FM_META_RE.search(text)
     if meta_match and not isinstance(result.get("metadata"), dict):
         try:
-            result["metadata"] = json.loads(meta_match.group(1))
-        except json.JSONDecodeError:
+            result["metadata"] = _loads(meta_match.group(1))
+        except _JSON_ERRORS:
             pass
     return result if result else None
 
 
-def _scan_skills(skill_dirs):
+# SKILL.md `os` values -> platform.system().lower() names
+_OS_MAP = {"darwin": "darwin", "linux": "linux", "win32": "windows"}
+_CURRENT_OS = platform.system().lower()
+
+
+def _build_path_index() -> Optional[dict[str, list[str]]]:
+    """Map each file name on PATH to its full paths, in PATH order.
+
+    One directory listing per PATH entry replaces per-lookup PATH walks.
+    Returns None on Windows, where PATHEXT lookup is left to shutil.which.
+    """
+    if os.name == "nt":
+        return None
+    index = {}
+    for d in dict.fromkeys(os.get_exec_path()):
+        try:
+            with os.scandir(d or os.curdir) as it:
+                for entry in it:
+                    index.setdefault(entry.name, []).append(os.path.join(d, entry.name))
+        except OSError:
+            continue
+    return index
+
+
+def _bin_on_path(bin_name, path_index) -> bool:
+    """Equivalent of `shutil.which(bin_name) is not None` using a PATH index.
+
+    The index matches names exactly, so a miss falls back to shutil.which,
+    which also finds case-insensitive matches (the macOS default).
+    """
+    if path_index is None or os.sep in bin_name or (os.altsep and os.altsep in bin_name):
+        return shutil.which(bin_name) is not None
+    return (any(os.access(p, os.X_OK) and not os.path.isdir(p)
+                for p in path_index.get(bin_name, ()))
+            or shutil.which(bin_name) is not None)
+
+
+# slots=True needs Python 3.10+; without it Skill is a regular dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclasses.dataclass(**_DATACLASS_SLOTS)
+class Skill:
+    """One SKILL.md and its dependency check results."""
+    name: str
+    path: str
+    skill_md_path: str
+    source: str
+    description: str
+    os_req: list
+    required_bins: list
+    optional_bins: list
+    bin_versions: dict
+    install_info: list
+    bins_status: dict = dataclasses.field(default_factory=dict)
+    optional_bins_status: dict = dataclasses.field(default_factory=dict)
+    version_issues: list = dataclasses.field(default_factory=list)
+    os_ok: bool = True
+    healthy: bool = True
+    warnings: list = dataclasses.field(default_factory=list)
+    issues: list = dataclasses.field(default_factory=list)
+    inferred_bins: list = dataclasses.field(default_factory=list)
+    inferred_bins_status: dict = dataclasses.field(default_factory=dict)
+
+
+def _scan_skills(skill_dirs, path_index=None) -> list[Skill]:
     """Scan skill directories and return skill info list."""
     skills = []
-    current_os = platform.system().lower()
+    current_os = _CURRENT_OS
     for skill_dir in skill_dirs:
-        if not os.path.isdir(skill_dir):
+        # <skill_dir>/*/SKILL.md, with each SKILL.md stat'ed once
+        try:
+            subdirs = _skill_subdirs(skill_dir)
+        except OSError:
             continue
-        for skill_path in sorted(glob.glob(os.path.join(skill_dir, "*/SKILL.md"))):
-            skill_name = os.path.basename(os.path.dirname(skill_path))
+        found = []
+        for name in subdirs:
+            skill_path = os.path.join(skill_dir, name, "SKILL.md")
+            try:
+                found.append((skill_path, name, os.stat(skill_path)))
+            except OSError:
+                continue
+        found.sort()
+        for skill_path, skill_name, st in found:
             source = "builtin" if "node_modules" in skill_path else "custom"
-            fm = _parse_skill_frontmatter(skill_path)
+            fm = _cached_skill_frontmatter(skill_path, st)
             meta = {}
             if fm and isinstance(fm, dict):
                 m = fm.get("metadata", {})
                 if isinstance(m, dict):
                     meta = m.get("openclaw", {})
             requires = meta.get("requires", {}) if meta else {}
-            skill = {
-                "name": skill_name,
-                "path": os.path.dirname(skill_path),
-                "skill_md_path": skill_path,
-                "source": source,
-                "description": fm.get("description", "") if fm else "",
-                "os_req": meta.get("os", []),
-                "required_bins": requires.get("bins", []),
-                "optional_bins": requires.get("optional_bins", []),
-                "bin_versions": requires.get("bin_versions", {}),
-                "install_info": meta.get("install", []) if meta else [],
-                "bins_status": {},
-                "optional_bins_status": {},
-                "version_issues": [],
-                "os_ok": True,
-                "healthy": True,
-                "warnings": [],
-                "issues": [],
-                "inferred_bins": [],
-                "inferred_bins_status": {},
-            }
-            if skill["os_req"]:
-                os_map = {"darwin": "darwin", "linux": "linux", "win32": "windows"}
-                if current_os not in [os_map.get(o, o) for o in skill["os_req"]]:
-                    skill["os_ok"] = False
-                    skill["healthy"] = False
-                    skill["issues"].append(f"OS mismatch: needs {skill['os_req']}, have {current_os}")
-            for bin_name in skill["required_bins"]:
-                found = shutil.which(bin_name) is not None
-                skill["bins_status"][bin_name] = found
+            skill = Skill(
+                name=skill_name,
+                path=os.path.dirname(skill_path),
+                skill_md_path=skill_path,
+                source=source,
+                description=fm.get("description", "") if fm else "",
+                os_req=meta.get("os", []),
+                required_bins=requires.get("bins", []),
+                optional_bins=requires.get("optional_bins", []),
+                bin_versions=requires.get("bin_versions", {}),
+                install_info=meta.get("install", []) if meta else [],
+            )
+            if skill.os_req:
+                if current_os not in {_OS_MAP.get(o, o) for o in skill.os_req}:
+                    skill.os_ok = False
+                    skill.healthy = False
+                    skill.issues.append(f"OS mismatch: needs {skill.os_req}, have {current_os}")
+            for bin_name in skill.required_bins:
+                found = _bin_on_path(bin_name, path_index)
+                skill.bins_status[bin_name] = found
                 if not found:
-                    skill["healthy"] = False
-                    skill["issues"].append(f"Missing binary: {bin_name}")
-            for bin_name in skill["optional_bins"]:
-                found = shutil.which(bin_name) is not None
-                skill["optional_bins_status"][bin_name] = found
+                    skill.healthy = False
+                    skill.issues.append(f"Missing binary: {bin_name}")
+            for bin_name in skill.optional_bins:
+                found = _bin_on_path(bin_name, path_index)
+                skill.optional_bins_status[bin_name] = found
                 if not found:
-                    skill["warnings"].append(f"Optional missing: {bin_name}")
+                    skill.warnings.append(f"Optional missing: {bin_name}")
             skills.append(skill)
     return skills
 
@@ -1347,7 +2005,7 @@ def _check_bin_version(bin_name, version_spec):
 def _skill_install_hint(skill):
     """Get install hints for a broken skill."""
     hints = []
-    for inst in skill.get("install_info", []):
+    for inst in skill.install_info:
         if isinstance(inst, dict):
             kind = inst.get("kind", "")
             if kind == "brew":
@@ -1364,34 +2022,35 @@ def _skill_install_hint(skill):
 def cmd_skills(args):
     """Skill dependency health check."""
     skill_dirs = _get_skill_dirs(extra_dirs=getattr(args, 'dirs', None))
-    skills = _scan_skills(skill_dirs)
+    path_index = _build_path_index()
+    skills = _scan_skills(skill_dirs, path_index)
     do_infer = getattr(args, 'infer', False)
     do_versions = getattr(args, 'check_versions', False)
 
     # Inference pass: scan SKILL.md body for deps when none declared
     if do_infer:
         for s in skills:
-            if not s["required_bins"] and not s["optional_bins"]:
-                inferred = _infer_deps_from_body(s["skill_md_path"])
-                s["inferred_bins"] = inferred
+            if not s.required_bins and not s.optional_bins:
+                inferred = _infer_deps_from_body(s.skill_md_path)
+                s.inferred_bins = inferred
                 for bin_name in inferred:
-                    found = shutil.which(bin_name) is not None
-                    s["inferred_bins_status"][bin_name] = found
+                    found = _bin_on_path(bin_name, path_index)
+                    s.inferred_bins_status[bin_name] = found
                     if not found:
-                        s["warnings"].append(f"Inferred missing: {bin_name}")
+                        s.warnings.append(f"Inferred missing: {bin_name}")
 
     # Version check pass
     if do_versions:
         for s in skills:
-            for bin_name, spec in s.get("bin_versions", {}).items():
-                if shutil.which(bin_name):
+            for bin_name, spec in s.bin_versions.items():
+                if _bin_on_path(bin_name, path_index):
                     actual, err = _check_bin_version(bin_name, spec)
                     if err:
-                        s["version_issues"].append(f"{bin_name}: {err}")
-                        s["warnings"].append(f"Version mismatch: {bin_name} ({err})")
+                        s.version_issues.append(f"{bin_name}: {err}")
+                        s.warnings.append(f"Version mismatch: {bin_name} ({err})")
 
     if getattr(args, 'skill', None):
-        skills = [s for s in skills if s["name"] == args.skill]
+        skills = [s for s in skills if s.name == args.skill]
         if not skills:
             print(f"Skill '{args.skill}' not found")
             sys.exit(1)
@@ -1399,30 +2058,30 @@ def cmd_skills(args):
     # Apply filter
     filt = getattr(args, 'filter', None)
     if filt == "broken":
-        skills = [s for s in skills if not s["healthy"]]
+        skills = [s for s in skills if not s.healthy]
     elif filt == "healthy":
-        skills = [s for s in skills if s["healthy"]]
+        skills = [s for s in skills if s.healthy]
 
-    healthy = [s for s in skills if s["healthy"]]
-    broken = [s for s in skills if not s["healthy"]]
-    no_deps = [s for s in skills if not s["required_bins"] and not s["os_req"] and not s["inferred_bins"]]
-    with_warnings = [s for s in skills if s["warnings"]]
+    healthy = [s for s in skills if s.healthy]
+    broken = [s for s in skills if not s.healthy]
+    no_deps = [s for s in skills if not s.required_bins and not s.os_req and not s.inferred_bins]
+    with_warnings = [s for s in skills if s.warnings]
 
     # Fix-hints mode: just print install commands
     if getattr(args, 'fix_hints', False):
         any_hints = False
-        for s in [sk for sk in skills if not sk["healthy"]]:
+        for s in [sk for sk in skills if not sk.healthy]:
             hints = _skill_install_hint(s)
             if hints:
-                print(f"# {s['name']}")
+                print(f"# {s.name}")
                 for h in hints:
                     print(h)
                 print()
                 any_hints = True
             else:
-                missing = [b for b, ok in s["bins_status"].items() if not ok]
+                missing = [b for b, ok in s.bins_status.items() if not ok]
                 if missing:
-                    print(f"# {s['name']} — no install info, missing: {', '.join(missing)}")
+                    print(f"# {s.name} — no install info, missing: {', '.join(missing)}")
                     print()
                     any_hints = True
         if not any_hints:
@@ -1431,10 +2090,14 @@ def cmd_skills(args):
 
     # JSON output
     if getattr(args, 'json_out', None):
-        target = sys.stdout if args.json_out == "-" else open(args.json_out, "w")
-        json.dump(skills, target, indent=2)
+        data = _dumps_pretty(skills)
         if args.json_out == "-":
-            print()
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data + b"\n")
+            sys.stdout.buffer.flush()
+        else:
+            with open(args.json_out, "wb") as f:
+                f.write(data)
         return
 
     print(f"\n🩺 Skill Health Report")
@@ -1452,8 +2115,8 @@ def cmd_skills(args):
         print(f"❌ BROKEN SKILLS ({len(broken)})")
         print(f"{'-'*60}")
         for s in broken:
-            print(f"\n  🔴 {s['name']} ({s['source']})")
-            for issue in s["issues"]:
+            print(f"\n  🔴 {s.name} ({s.source})")
+            for issue in s.issues:
                 print(f"     ⚠️  {issue}")
             hints = _skill_install_hint(s)
             for h in hints:
@@ -1466,33 +2129,33 @@ def cmd_skills(args):
         for s in with_warnings:
             if s in broken:
                 continue  # already shown above
-            print(f"\n  🟡 {s['name']} ({s['source']})")
-            for w in s["warnings"]:
+            print(f"\n  🟡 {s.name} ({s.source})")
+            for w in s.warnings:
                 print(f"     ⚠️  {w}")
         print()
 
     if do_infer:
-        inferred_skills = [s for s in skills if s["inferred_bins"]]
+        inferred_skills = [s for s in skills if s.inferred_bins]
         if inferred_skills:
             print(f"🔍 INFERRED DEPENDENCIES ({len(inferred_skills)} skills)")
             print(f"{'-'*60}")
             for s in inferred_skills:
-                found = [b for b, ok in s["inferred_bins_status"].items() if ok]
-                missing = [b for b, ok in s["inferred_bins_status"].items() if not ok]
+                found = [b for b, ok in s.inferred_bins_status.items() if ok]
+                missing = [b for b, ok in s.inferred_bins_status.items() if not ok]
                 status_parts = []
                 if found:
                     status_parts.append(f"✅ {', '.join(found)}")
                 if missing:
                     status_parts.append(f"❌ {', '.join(missing)}")
-                print(f"  {s['name']}: {' | '.join(status_parts)}")
+                print(f"  {s.name}: {' | '.join(status_parts)}")
             print()
 
     if getattr(args, 'verbose', False):
         print(f"✅ HEALTHY SKILLS ({len(healthy)})")
         print(f"{'-'*60}")
         for s in healthy:
-            bins = ", ".join(s["required_bins"]) if s["required_bins"] else "none"
-            print(f"  🟢 {s['name']} ({s['source']}) — bins: {bins}")
+            bins = ", ".join(s.required_bins) if s.required_bins else "none"
+            print(f"  🟢 {s.name} ({s.source}) — bins: {bins}")
         print()
 
 
@@ -1527,6 +2190,8 @@ Examples:
 
     # Common --dir argument for all subcommands
     dir_kwargs = {"help": "Clawdbot config directory (default: ~/.clawdbot or ~/.openclaw)"}
+    jobs_kwargs = {"type": int, "default": DEFAULT_JOBS, "metavar": "N",
+                   "help": f"Parallel worker processes for parsing sessions (default: {DEFAULT_JOBS})"}
 
     # scan
     p_scan = subparsers.add_parser("scan", help="Full health scan")
@@ -1534,8 +2199,10 @@ Examples:
     p_scan.add_argument("--agent", help="Filter to specific agent")
     p_scan.add_argument("--top", type=int, default=LARGE_SESSION_TOP_N, help="Show top N issues per agent")
     p_scan.add_argument("--include-deleted", action="store_true", help="Include soft-deleted sessions")
-    p_scan.add_argument("--json", metavar="FILE", help="Export report as JSON")
+    p_scan.add_argument("--json", metavar="FILE",
+                        help="Export report as JSON (.json) or JSON Lines (any other extension)")
     p_scan.add_argument("--verbose", action="store_true", help="Include all session details in JSON")
+    p_scan.add_argument("--jobs", **jobs_kwargs)
     p_scan.set_defaults(func=cmd_scan)
 
     # top
@@ -1544,6 +2211,7 @@ Examples:
     p_top.add_argument("-n", "--count", type=int, default=LARGE_SESSION_TOP_N, help="Number of sessions")
     p_top.add_argument("--sort", choices=["size", "messages"], default="size", help="Sort by")
     p_top.add_argument("--agent", help="Filter to specific agent")
+    p_top.add_argument("--jobs", **jobs_kwargs)
     p_top.set_defaults(func=cmd_top)
 
     # inspect
@@ -1557,12 +2225,14 @@ Examples:
     p_tools.add_argument("--dir", **dir_kwargs)
     p_tools.add_argument("--agent", help="Filter to specific agent")
     p_tools.add_argument("-n", "--count", type=int, default=30, help="Top N tools")
+    p_tools.add_argument("--jobs", **jobs_kwargs)
     p_tools.set_defaults(func=cmd_tools)
 
     # models
     p_models = subparsers.add_parser("models", help="Model usage patterns")
     p_models.add_argument("--dir", **dir_kwargs)
     p_models.add_argument("--agent", help="Filter to specific agent")
+    p_models.add_argument("--jobs", **jobs_kwargs)
     p_models.set_defaults(func=cmd_models)
 
     # disk
@@ -1585,6 +2255,8 @@ Examples:
     p_history = subparsers.add_parser("history", help="View session health trends over time")
     p_history.add_argument("--dir", **dir_kwargs)
     p_history.add_argument("--days", type=int, default=30, help="Number of days of history (default: 30)")
+    p_history.add_argument("--jobs", type=int, default=DEFAULT_IO_THREADS, metavar="N",
+                           help=f"Parallel threads for reading session files (default: {DEFAULT_IO_THREADS})")
     p_history.set_defaults(func=cmd_history)
 
     # skills